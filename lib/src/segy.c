@@ -19,6 +19,10 @@
   #include <sys/stat.h>
 #endif //HAVE_SYS_STAT_H
 
+#ifdef HAVE_POSIX_FADVISE
+  #include <fcntl.h>
+#endif //HAVE_POSIX_FADVISE
+
 #include <assert.h>
 #include <limits.h>
 #include <math.h>
@@ -168,23 +172,37 @@ void ascii2ebcdic( const char* ascii, char* ebcdic ) {
 #define IEMINIB 0x21200000
 
 static inline void ibm_native( void* buf ) {
-    static int it[8] = { 0x21800000, 0x21400000, 0x21000000, 0x21000000,
-                         0x20c00000, 0x20c00000, 0x20c00000, 0x20c00000 };
-    static int mt[8] = { 8, 4, 2, 2, 1, 1, 1, 1 };
-    unsigned int manthi, iexp, inabs;
-    int ix;
+    /*
+     * The mantissa is normalised by shifting it 0-3 bits, depending on the
+     * number of leading zeros in its top hex digit, and the exponent is
+     * adjusted accordingly. This is sometimes written with lookup tables
+     * indexed by the top 3 bits of the mantissa:
+     *
+     *   it = { 0x21800000, 0x21400000, 0x21000000, 0x21000000,
+     *          0x20c00000, 0x20c00000, 0x20c00000, 0x20c00000 }
+     *   mt = { 8, 4, 2, 2, 1, 1, 1, 1 }
+     *
+     * but computing the shift (and the multiplier mt = 1 << shift) with
+     * comparisons gives the exact same result for all inputs, and without the
+     * table lookups and variable shifts the compiler can vectorise loops over
+     * this function.
+     */
     uint32_t u;
-
     memcpy( &u, buf, sizeof( u ) );
 
-    manthi = u & 0x00ffffff;
-    ix     = manthi >> 21;
-    iexp   = ( ( u & 0x7f000000 ) - it[ix] ) << 1;
-    manthi = manthi * mt[ix] + iexp;
-    inabs  = u & 0x7fffffff;
-    if ( inabs > IEMAXIB ) manthi = IEEEMAX;
+    const uint32_t mant  = u & 0x00ffffff;
+    const uint32_t lz1   = mant < 0x800000;
+    const uint32_t lz2   = mant < 0x400000;
+    const uint32_t lz3   = mant < 0x200000;
+    const uint32_t shift = lz1 + lz2 + lz3;
+    const uint32_t mt    = 1 + lz1 + 2 * lz2 + 4 * lz3;
+    const uint32_t iexp  = ( ( u & 0x7f000000 ) - 0x20c00000 - shift * 0x00400000 ) << 1;
+    const uint32_t inabs = u & 0x7fffffff;
+
+    uint32_t manthi = mant * mt + iexp;
+    manthi = inabs > IEMAXIB ? IEEEMAX : manthi;
     manthi = manthi | ( u & 0x80000000 );
-    u = ( inabs < IEMINIB ) ? 0 : manthi;
+    u = inabs < IEMINIB ? 0 : manthi;
     memcpy( buf, &u, sizeof( u ) );
 }
 
@@ -734,6 +752,18 @@ static int32_t bswap_header_word(int32_t f, int word_size) {
     return (int16_t) bswap16((int16_t) f);
 }
 
+/*
+ * Upper bound (in bytes) of the chunk read by segy_field_forall to gather
+ * multiple header words in a single fread
+ */
+#define FIELD_WINDOW_SIZE (64 * 1024)
+
+/*
+ * Scans covering more than this many bytes tell the kernel up front that the
+ * file is read sequentially, so that readahead can issue large requests
+ */
+#define FIELD_SEQUENTIAL_SIZE (64LL * 1024 * 1024)
+
 int segy_field_forall( segy_file* fp,
                        int field,
                        int start,
@@ -786,20 +816,73 @@ int segy_field_forall( segy_file* fp,
      * words in the buffer rely on 0-based offsets.
      *
      * Always read 4 bytes to be sure, there's no significant cost difference.
+     *
+     * Seeking and reading a single word per trace makes this a syscall-bound
+     * loop of many tiny reads. When the words are close enough together (at
+     * least 8 fit in a window), read a window of several traces with a single
+     * fread, and pick the words out of that instead. If the window can't be
+     * allocated, or the traces are too far apart, this degrades to reading
+     * one word at a time.
      */
     const int zfield = field - 1;
-    for( int i = start; slicelen > 0; i += step, ++buf, --slicelen ) {
-        err = segy_seek( fp, i, trace0 + zfield, trace_bsize );
-        if( err != 0 ) return SEGY_FSEEK_ERROR;
-        size_t readc = fread( header + zfield, sizeof(uint32_t), 1, fp->fp );
-        if( readc != 1 ) return SEGY_FREAD_ERROR;
+    const long long trsize = (long long)trace_bsize + SEGY_TRACE_HEADER_SIZE;
+    const long long span = trsize * (step < 0 ? -step : step);
+
+    int batch = 1;
+    char single[ sizeof(uint32_t) ];
+    char* window = single;
+    if( slicelen > 1 && span <= FIELD_WINDOW_SIZE / 8 ) {
+        char* mem = malloc( FIELD_WINDOW_SIZE );
+        if( mem ) {
+            window = mem;
+            batch = (int)((FIELD_WINDOW_SIZE - sizeof(uint32_t)) / span) + 1;
+        }
+    }
 
-        get_field( header, field_size, field, &f );
-        if (lsb) f = bswap_header_word(f, word_size);
-        *buf = f;
+#ifdef HAVE_POSIX_FADVISE
+    /*
+     * Windowed reads walk the file front-to-back (or back-to-front) in big
+     * chunks, which is a sequential read in disguise. Declaring it helps on
+     * cold caches and spinning disks, and is reset once the scan is done so
+     * that later random trace access isn't penalised. The advice is only a
+     * hint, so failures are ignored.
+     */
+    const long long region = span * (slicelen - 1) + trsize;
+    const int sequential = batch > 1 && region >= FIELD_SEQUENTIAL_SIZE;
+    if( sequential ) {
+        const int first = step > 0 ? start : end;
+        const long long offset = trace0 + first * trsize;
+        posix_fadvise( fileno( fp->fp ), offset, region, POSIX_FADV_SEQUENTIAL );
     }
+#endif //HAVE_POSIX_FADVISE
 
-    return SEGY_OK;
+    err = SEGY_OK;
+    for( int i = start; slicelen > 0; ) {
+        const int n = slicelen < batch ? slicelen : batch;
+        const int first = step > 0 ? i : i + step * (n - 1);
+        const size_t len = (size_t)(span * (n - 1)) + sizeof(uint32_t);
+
+        err = segy_seek( fp, first, trace0 + zfield, trace_bsize );
+        if( err != 0 ) { err = SEGY_FSEEK_ERROR; break; }
+        size_t readc = fread( window, len, 1, fp->fp );
+        if( readc != 1 ) { err = SEGY_FREAD_ERROR; break; }
+
+        for( int k = 0; k < n; ++k, i += step, ++buf, --slicelen ) {
+            const char* word = window + (long long)(i - first) * trsize;
+            memcpy( header + zfield, word, sizeof(uint32_t) );
+
+            get_field( header, field_size, field, &f );
+            if (lsb) f = bswap_header_word(f, word_size);
+            *buf = f;
+        }
+    }
+
+    if( batch > 1 ) free( window );
+#ifdef HAVE_POSIX_FADVISE
+    if( sequential )
+        posix_fadvise( fileno( fp->fp ), 0, 0, POSIX_FADV_NORMAL );
+#endif //HAVE_POSIX_FADVISE
+    return err;
 }
 
 /*
@@ -2140,6 +2223,29 @@ static int segy_native_byteswap(int format, long long size, void* buf) {
     return SEGY_OK;
 }
 
+/*
+ * Decode big-endian ibm floats to native ieee floats. Byte swapping and
+ * converting the whole buffer in two separate passes reads it from memory
+ * twice for large buffers, so instead do both passes over small blocks that
+ * stay in cache. The conversion loop has a constant stride, because ibm
+ * floats are always 4 bytes, which lets the compiler vectorise it.
+ */
+#define IBM_BLOCK_SIZE 1024
+
+static void ibm_to_native( long long size, void* buf ) {
+    char* dst = (char*)buf;
+    while( size > 0 ) {
+        const long long n = size < IBM_BLOCK_SIZE ? size : IBM_BLOCK_SIZE;
+
+        if( HOST_LSB ) bswap32vec( dst, n );
+        for( long long i = 0; i < n; ++i )
+            ibm_native( dst + i * sizeof( uint32_t ) );
+
+        dst += n * sizeof( uint32_t );
+        size -= n;
+    }
+}
+
 int segy_to_native( int format,
                     long long size,
                     void* buf ) {
@@ -2147,12 +2253,14 @@ int segy_to_native( int format,
     const int elemsize = formatsize( format );
     if( elemsize < 0 ) return SEGY_INVALID_ARGS;
 
-    segy_native_byteswap( format, size, buf );
+    switch( format ) {
+        case SEGY_IBM_FLOAT_4_BYTE:
+            ibm_to_native( size, buf );
+            break;
 
-    char* dst = (char*)buf;
-    if( format == SEGY_IBM_FLOAT_4_BYTE ) {
-        for( long long i = 0; i < size; ++i )
-            ibm_native( dst + i * elemsize );
+        default:
+            segy_native_byteswap( format, size, buf );
+            break;
     }
 
     return SEGY_OK;
@@ -416,8 +416,11 @@ class Field(MutableMapping):
         5
         """
 
-        self.putfield(self.buf, key, val)
-        self.flush()
+        # write to a copy, and only keep it when it made it to disk, so that a
+        # failed write doesn't leave the cache out of sync with the file
+        buf = bytearray(self.buf)
+        self.putfield(buf, key, val)
+        self.commit(buf)
 
         return val
 
@@ -522,8 +525,21 @@ class Field(MutableMapping):
         for key, value in kwargs.items():
             self.putfield(buf, int(self._kwargs[key]), value)
 
-        self.buf = buf
-        self.flush()
+        self.commit(buf)
+
+    def commit(self, buf):
+        """Write buf to disk, and make it the backing storage
+
+        This method is largely internal. The backing storage is only replaced
+        if the write succeeds, so that the object stays consistent with disk
+        if it fails.
+        """
+        old, self.buf = self.buf, buf
+        try:
+            self.flush()
+        except:
+            self.buf = old
+            raise
 
     @classmethod
     def binary(cls, segy):
@@ -34,7 +34,9 @@ def open(filename, mode="r", iline = 189,
                              xline = 193,
                              strict = True,
                              ignore_geometry = False,
-                             endian = 'big'):
+                             endian = 'big',
+                             use_memmap = True,
+                             headers_only = False):
     """Open a segy file.
 
     Opens a segy file and tries to figure out its sorting, inline numbers,
@@ -63,6 +65,19 @@ def open(filename, mode="r", iline = 189,
     essentially the same as using ``strict=False`` on a file that has no
     geometry.
 
+    Files opened read-only are memory mapped by default, which makes reading
+    faster, in particular for many small reads such as header words. Pass
+    ``use_memmap=False`` to opt out, e.g. if the file is on a network file
+    system where memory mapping performs poorly. If memory mapping fails,
+    segyio silently falls back to regular file reads.
+
+    If ``headers_only=True``, segyio only reads what is needed to describe the
+    file layout, and skips memory mapping, the sample axis and geometry
+    inference. This is the fastest way to open a file to look at its textual
+    and binary headers, e.g. when triaging many files. Traces and trace
+    headers can still be read, but ``samples`` is None and the file is
+    unstructured.
+
     Parameters
     ----------
 
@@ -90,6 +105,13 @@ def open(filename, mode="r", iline = 189,
     endian : {'big', 'msb', 'little', 'lsb'}
         File endianness, big/msb (default) or little/lsb
 
+    use_memmap : bool, optional
+        Memory map the file if it is opened read-only. Defaults to True.
+
+    headers_only : bool, optional
+        Only prepare the file for reading the textual and binary headers.
+        Defaults to False.
+
     Returns
     -------
 
@@ -110,6 +132,12 @@ def open(filename, mode="r", iline = 189,
     .. versionchanged:: 1.8
         endian argument
 
+    .. versionchanged:: 1.10
+        use_memmap argument, read-only files are memory mapped by default
+
+    .. versionchanged:: 1.10
+        headers_only argument
+
     When a file is opened non-strict, only raw traces access is allowed, and
     using modes such as ``iline`` raise an error.
 
@@ -171,6 +199,12 @@ def open(filename, mode="r", iline = 189,
             endian = endian,
     )
 
+    if headers_only:
+        return f
+
+    if use_memmap and f.readonly:
+        f.mmap()
+
     try:
         dt = segyio.tools.dt(f, fallback_dt = 4000.0) / 1000.0
         t0 = f.header[0][segyio.TraceField.DelayRecordingTime]
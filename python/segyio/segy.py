@@ -1,8 +1,5 @@
+import os
 import warnings
-try:
-    from future_builtins import zip
-    range = xrange
-except (NameError, ImportError): pass
 
 import numpy as np
 
@@ -11,8 +8,59 @@ from .line import Line
 from .trace import Trace, Header, Attributes, Text
 from .field import Field
 
+from .tracefield import TraceField
 from .tracesortingformat import TraceSortingFormat
 
+# numpy dtype of samples, by format code
+_DTYPE_BY_FORMAT = {
+   -1: np.dtype(np.float32),
+    1: np.dtype(np.float32),
+    2: np.dtype(np.int32),
+    3: np.dtype(np.int16),
+    5: np.dtype(np.float32),
+    6: np.dtype(np.float64),
+    8: np.dtype(np.int8),
+    9: np.dtype(np.int64),
+    10: np.dtype(np.uint32),
+    11: np.dtype(np.uint16),
+    12: np.dtype(np.uint64),
+    16: np.dtype(np.uint8),
+}
+
+_FORMAT_NAMES = {
+   -2: "4-byte native big-endian float",
+   -1: "4-byte native little-endian float",
+    1: "4-byte IBM float",
+    2: "4-byte signed integer",
+    3: "2-byte signed integer",
+    4: "4-byte fixed point with gain",
+    5: "4-byte IEEE float",
+    6: "8-byte IEEE float",
+    7: "3-byte signed integer",
+    8: "1-byte signed char",
+    9: "8-byte signed integer",
+    10: "4-byte unsigned integer",
+    11: "2-byte unsigned integer",
+    12: "8-byte unsigned integer",
+    15: "3-byte unsigned integer",
+    16: "1-byte unsigned char"
+}
+
+
+class Format(object):
+    """Sample format of a file
+
+    The int() of a Format is the format code from the binary header, and the
+    str() is a human readable description of it.
+    """
+    def __init__(self, fmt):
+        self.fmt = fmt
+
+    def __int__(self):
+        return self.fmt
+
+    def __str__(self):
+        return _FORMAT_NAMES.get(self.fmt, "Unknown format")
 
 
 class SegyFile(object):
@@ -23,6 +71,11 @@ class SegyFile(object):
 
     _unstructured_errmsg = "File opened in unstructured mode."
 
+    # the trace header words are laid out back-to-back, so the size of a word
+    # is the distance (in bytes) to the next one
+    _tr_offsets = sorted(int(x) for x in TraceField.enums())
+    _tr_wordsizes = dict(zip(_tr_offsets, np.diff(_tr_offsets + [241])))
+
     def __init__(self, fd, filename, mode, iline=189,
                                            xline=193,
                                            endian='big',
@@ -46,27 +99,31 @@ class SegyFile(object):
         self._xline_length = None
         self._xline_stride = None
 
+        self._mmap = None
+        self._words = {}
+        self._mapped_samples = None
+        self._bin = None
+
+        # identity of the file as it was opened, so that mmap() can make sure
+        # the numpy map is of the same file, even if the working directory
+        # changed or the path now points to another file
+        try:
+            self._abspath = os.path.abspath(filename)
+            st = os.stat(self._abspath)
+            self._fileid = (st.st_dev, st.st_ino)
+        except (EnvironmentError, TypeError, ValueError):
+            self._abspath = None
+            self._fileid = None
+
         self.xfd = fd
         metrics = self.xfd.metrics()
         self._fmt = metrics['format']
         self._tracecount = metrics['tracecount']
         self._ext_headers = metrics['ext_headers']
+        self._samplecount = metrics['samplecount']
 
         try:
-            self._dtype = np.dtype({
-               -1: np.float32,
-                1: np.float32,
-                2: np.int32,
-                3: np.int16,
-                5: np.float32,
-                6: np.float64,
-                8: np.int8,
-                9: np.int64,
-                10: np.uint32,
-                11: np.uint16,
-                12: np.uint64,
-                16: np.uint8,
-            }[self._fmt])
+            self._dtype = _DTYPE_BY_FORMAT[self._fmt]
         except KeyError:
             problem = 'Unknown trace value format {}'.format(self._fmt)
             solution = 'falling back to ibm float'
@@ -74,13 +131,9 @@ class SegyFile(object):
             self._fmt = 1
             self._dtype = np.dtype(np.float32)
 
-        self._trace = Trace(self.xfd,
-                            self.dtype,
-                            self.tracecount,
-                            metrics['samplecount'],
-                            self.readonly,
-                           )
-        self._header = Header(self)
+        # trace and header modes are created on first access
+        self._trace = None
+        self._header = None
         self._iline = None
         self._xline = None
         self._gather = None
@@ -173,6 +226,13 @@ class SegyFile(object):
 
 
         """
+        # drop the views of the memory map, so that readers fall back to the
+        # (closed) file handle and fail
+        self._mmap = None
+        self._words = {}
+        self._mapped_samples = None
+        self._bin = None
+        self._trace = None
         self.xfd.close()
 
     def mmap(self):
@@ -193,6 +253,13 @@ class SegyFile(object):
         using segyio - reading and writing falls back on non-memory mapped
         features.
 
+        Files opened read-only with ``segyio.open`` are memory mapped by
+        default, in which case calling this method is a no-op.
+
+        Traces in memory mapped read-only files are read with numpy directly
+        from the map, unless the sample format needs conversion, like IBM
+        float does.
+
         Returns
         -------
 
@@ -205,6 +272,9 @@ class SegyFile(object):
 
         .. versionadded:: 1.1
 
+        .. versionchanged:: 1.10
+            Traces in read-only files are read directly from the map
+
 
         Examples
         --------
@@ -219,7 +289,35 @@ class SegyFile(object):
         1.02548
 
         """
-        return self.xfd.mmap()
+        mapped = self.xfd.mmap()
+
+        if mapped and self.readonly and self._mmap is None:
+            # keep a read-only numpy view of the same file around, to enable
+            # reading with plain numpy operations, e.g. strided views of
+            # header words. If this fails, segyio still works fine through the
+            # file handle
+            try:
+                self._mmap = self._memmap()
+            except (EnvironmentError, ValueError):
+                pass
+
+            if self._mmap is not None:
+                self._mapped_samples = self._trace_samples()
+
+        return mapped
+
+    def _memmap(self):
+        """Map the file with numpy, or None if it is not the file segyio opened
+        """
+        if self._fileid is None:
+            return None
+
+        with open(self._abspath, 'rb') as f:
+            st = os.fstat(f.fileno())
+            if (st.st_dev, st.st_ino) != self._fileid:
+                return None
+
+            return np.memmap(f, dtype=np.uint8, mode='r')
 
     @property
     def dtype(self):
@@ -350,6 +448,10 @@ class SegyFile(object):
         -----
         .. versionadded:: 1.1
         """
+        if self._header is not None:
+            return self._header
+
+        self._header = Header(self)
         return self._header
 
     @header.setter
@@ -414,7 +516,69 @@ class SegyFile(object):
         .. versionadded:: 1.1
 
         """
-        return Attributes(field, self.xfd, self.tracecount)
+        return Attributes(field, self.xfd, self.tracecount, self)
+
+    def _attribute_words(self, field):
+        """Strided view of the header word field for all traces
+
+        Returns a numpy array, in file byte order, of the header word field in
+        every trace, backed by the file memory map. If the file is not memory
+        mapped, or the field is not a valid header word, returns None.
+
+        The views are cached, and dropped when the file is closed.
+        """
+        if self._mmap is None:
+            return None
+
+        try:
+            return self._words[field]
+        except KeyError:
+            pass
+
+        try:
+            size = self._tr_wordsizes[int(field)]
+        except (KeyError, TypeError, ValueError):
+            # leave it to the file handle to report bad fields
+            return None
+
+        metrics = self.xfd.metrics()
+        order = '<' if self.endian in ('little', 'lsb') else '>'
+        words = np.ndarray(shape = (self.tracecount,),
+                           dtype = '{}i{}'.format(order, size),
+                           buffer = self._mmap,
+                           offset = metrics['trace0'] + int(field) - 1,
+                           strides = (metrics['trace_bsize'] + 240,),
+                          )
+        self._words[field] = words
+        return words
+
+    def _trace_samples(self):
+        """Strided view of the samples of all traces
+
+        Returns a 2-dimensional numpy array, in file byte order, of the samples
+        of every trace, backed by the file memory map. If the file is not
+        memory mapped, or the sample format has no direct numpy equivalent
+        (e.g. IBM float), returns None.
+        """
+        if self._mmap is None:
+            return None
+
+        if self._fmt not in _DTYPE_BY_FORMAT or self._fmt in (-1, 1):
+            return None
+
+        metrics = self.xfd.metrics()
+        order = '<' if self.endian in ('little', 'lsb') else '>'
+        dtype = self.dtype.newbyteorder(order)
+        try:
+            return np.ndarray(shape = (self.tracecount, self._samplecount),
+                              dtype = dtype,
+                              buffer = self._mmap,
+                              offset = metrics['trace0'] + 240,
+                              strides = (metrics['trace_bsize'] + 240,
+                                         dtype.itemsize),
+                             )
+        except (TypeError, ValueError):
+            return None
 
     @property
     def trace(self):
@@ -431,6 +595,16 @@ class SegyFile(object):
 
         """
 
+        if self._trace is not None:
+            return self._trace
+
+        self._trace = Trace(self.xfd,
+                            self.dtype,
+                            self.tracecount,
+                            self._samplecount,
+                            self.readonly,
+                            self,
+                           )
         return self._trace
 
     @trace.setter
@@ -787,9 +961,17 @@ class SegyFile(object):
         Notes
         -----
         .. versionadded:: 1.1
+
+        .. versionchanged:: 1.10
+            The binary header is read once and the same Field is returned on
+            every access. Writes go through this Field, and are immediately
+            visible to all other users of ``bin``
         """
 
-        return Field.binary(self)
+        if self._bin is None:
+            self._bin = Field.binary(self)
+
+        return self._bin
 
     @bin.setter
     def bin(self, value):
@@ -808,36 +990,7 @@ class SegyFile(object):
 
     @property
     def format(self):
-        d = {
-           -2: "4-byte native big-endian float",
-           -1: "4-byte native little-endian float",
-            1: "4-byte IBM float",
-            2: "4-byte signed integer",
-            3: "2-byte signed integer",
-            4: "4-byte fixed point with gain",
-            5: "4-byte IEEE float",
-            6: "8-byte IEEE float",
-            7: "3-byte signed integer",
-            8: "1-byte signed char",
-            9: "8-byte signed integer",
-            10: "4-byte unsigned integer",
-            11: "2-byte unsigned integer",
-            12: "8-byte unsigned integer",
-            15: "3-byte unsigned integer",
-            16: "1-byte unsigned char"
-        }
-
-        class fmt:
-            def __int__(inner):
-                return self._fmt
-
-            def __str__(inner):
-                if not self._fmt in d:
-                    return "Unknown format"
-
-                return d[self._fmt]
-
-        return fmt()
+        return Format(self._fmt)
 
     @property
     def readonly(self):
@@ -1031,7 +1031,14 @@ PyObject* gettr( segyiofd* self, PyObject* args ) {
 
     if( err ) return Error( err );
 
-    segy_to_native( self->format, bufsize, buffer.buf() );
+    /*
+     * the conversion only touches the output buffer, so other threads can
+     * run, and read into other buffers, while it's going on
+     */
+    const int format = self->format;
+    Py_BEGIN_ALLOW_THREADS
+    segy_to_native( format, bufsize, buffer.buf() );
+    Py_END_ALLOW_THREADS
 
     Py_INCREF( bufferobj );
     return bufferobj;
@@ -1044,30 +1051,41 @@ PyObject* puttr( segyiofd* self, PyObject* args ) {
     int traceno;
     char* buffer;
     Py_ssize_t buflen;
+    int step = 1;
+    int length = 1;
 
-    if( !PyArg_ParseTuple( args, "is#", &traceno, &buffer, &buflen ) )
+    if( !PyArg_ParseTuple( args, "is#|ii", &traceno, &buffer, &buflen,
+                                           &step, &length ) )
         return NULL;
 
-    if( self->trace_bsize > buflen )
-        return ValueError("trace too short: expected %d bytes, got %d",
-                          self->trace_bsize,
+    const long long bufsize = (long long) length * self->trace_bsize;
+    if( bufsize > buflen )
+        return ValueError("trace too short: expected %lld bytes, got %zd",
+                          bufsize,
                           buflen );
 
-    segy_from_native( self->format, self->samplecount, buffer );
+    const long long samples = (long long) length * self->samplecount;
+    segy_from_native( self->format, samples, buffer );
 
-    int err = segy_writetrace( fp, traceno,
-                                   buffer,
+    int err = 0;
+    int i = 0;
+    const char* src = buffer;
+    for( ; err == 0 && i < length; ++i, src += self->trace_bsize ) {
+        err = segy_writetrace( fp, traceno + (i * step),
+                                   src,
                                    self->trace0,
                                    self->trace_bsize );
+    }
 
-    segy_to_native( self->format, self->samplecount, buffer );
+    segy_to_native( self->format, samples, buffer );
 
     switch( err ) {
         case SEGY_OK:
             return Py_BuildValue("");
 
         case SEGY_FREAD_ERROR:
-            return IOError( "I/O operation failed on data trace %d", traceno );
+            return IOError( "I/O operation failed on data trace %d",
+                            traceno + ((i - 1) * step) );
 
         default:
             return Error( err );
@@ -24,7 +24,8 @@ def open(filename, mode = 'r', iline = 189,
                                xline = 193,
                                strict = True,
                                ignore_geometry = False,
-                               endian = 'big' ):
+                               endian = 'big',
+                               use_memmap = True ):
     """Open a seismic unix file.
 
     Behaves identically to open(), except it expects the seismic unix format,
@@ -56,6 +57,9 @@ def open(filename, mode = 'r', iline = 189,
     endian : {'big', 'msb', 'little', 'lsb'}
         File endianness, big/msb (default) or little/lsb
 
+    use_memmap : bool, optional
+        Memory map the file if it is opened read-only. Defaults to True.
+
     Returns
     -------
     file : segyio.su.file
@@ -73,6 +77,9 @@ def open(filename, mode = 'r', iline = 189,
     Notes
     -----
     .. versionadded:: 1.8
+
+    .. versionchanged:: 1.10
+        use_memmap argument, read-only files are memory mapped by default
     """
 
     if 'w' in mode:
@@ -103,8 +110,12 @@ def open(filename, mode = 'r', iline = 189,
         mode = mode,
         iline = iline,
         xline = xline,
+        endian = endian,
     )
 
+    if use_memmap and f.readonly:
+        f.mmap()
+
     h0 = f.header[0]
 
     dt = h0[words.dt] / 1000.0
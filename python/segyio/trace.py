@@ -5,6 +5,7 @@ except ImportError:
 
 import contextlib
 import itertools
+import numbers
 import warnings
 import sys
 try: from future_builtins import zip
@@ -16,6 +17,13 @@ from .line import HeaderLine
 from .field import Field
 from .utils import castarray
 
+def slicelength(start, stop, step):
+    # the number of elements in range(start, stop, step), computed directly,
+    # for start, stop, step as returned by slice.indices
+    if step > 0:
+        return max(0, (stop - start + step - 1) // step)
+    return max(0, (start - stop - step - 1) // -step)
+
 class Sequence(Sequence):
 
     # unify the common optimisations and boilerplate of Trace, RawTrace, and
@@ -102,12 +110,25 @@ class Trace(Sequence):
 
     """
 
-    def __init__(self, filehandle, dtype, tracecount, samples, readonly):
+    def __init__(self, filehandle, dtype, tracecount, samples, readonly,
+                                                                segy = None):
         super(Trace, self).__init__(tracecount)
         self.filehandle = filehandle
         self.dtype = dtype
         self.shape = samples
         self.readonly = readonly
+        self.segy = segy
+
+    @property
+    def mapped(self):
+        # when the file is memory mapped and the samples need no conversion
+        # other than byte order, mapped is a (strided) 2-dimensional view of
+        # all the samples, in file byte order. It is looked up on every read,
+        # so that it goes away when the file is closed
+        if self.segy is None:
+            return None
+
+        return self.segy._mapped_samples
 
     def __getitem__(self, i):
         """trace[i] or trace[i, j]
@@ -175,6 +196,10 @@ class Trace(Sequence):
         try:
             # optimize for the default case when i is a single trace index
             i = self.wrapindex(i)
+            mapped = self.mapped
+            if mapped is not None:
+                return mapped[i].astype(self.dtype)
+
             buf = np.zeros(self.shape, dtype = self.dtype)
             return self.filehandle.gettr(buf, i, 1, 1, 0, self.shape, 1, self.shape)
         except TypeError:
@@ -198,10 +223,18 @@ class Trace(Sequence):
             step = 1
             single = True
 
-        n_elements = len(range(start, stop, step))
+        n_elements = slicelength(start, stop, step)
+        # stop is -1 when a negative step runs past the first sample, which
+        # for a plain slice means the last sample
+        samples = slice(start, stop if stop >= 0 else None, step)
 
         try:
             i = self.wrapindex(i)
+            mapped = self.mapped
+            if mapped is not None:
+                tr = mapped[i, samples].astype(self.dtype)
+                return tr[0] if single else tr
+
             buf = np.zeros(n_elements, dtype = self.dtype)
             tr = self.filehandle.gettr(buf, i, 1, 1, start, stop, step, n_elements)
             return tr[0] if single else tr
@@ -221,7 +254,11 @@ class Trace(Sequence):
                 y = np.zeros(n_elements, dtype=self.dtype)
 
                 for k in range(*indices):
-                    self.filehandle.gettr(x, k, 1, 1, start, stop, step, n_elements)
+                    mapped = self.mapped
+                    if mapped is not None:
+                        np.copyto(x, mapped[k, samples])
+                    else:
+                        self.filehandle.gettr(x, k, 1, 1, start, stop, step, n_elements)
                     x, y = y, x
                     yield y
 
@@ -260,6 +297,11 @@ class Trace(Sequence):
         -----
         .. versionadded:: 1.1
 
+        .. versionchanged:: 1.10
+            Slices assigned from a 2-dimensional numpy.ndarray with one trace
+            per row, or from the traces of another file with the same sample
+            count and format, are written in blocks
+
         Behaves like [] for lists.
 
         Examples
@@ -278,7 +320,41 @@ class Trace(Sequence):
 
         """
         if isinstance(i, slice):
-            for j, x in zip(range(*i.indices(len(self))), val):
+            start, stop, step = i.indices(len(self))
+            indices = range(start, stop, step)
+
+            # a block of traces of the right width can be handed over to the
+            # file handle in one go, rather than one trace at a time
+            if (isinstance(val, np.ndarray) and val.ndim == 2
+                    and val.shape[1] == self.shape):
+                length = min(slicelength(start, stop, step), len(val))
+                if length == 0: return
+                xs = val[:length]
+                # traces are written one row at a time, so only warn about
+                # non-contiguous input when the rows themselves are strided
+                if xs.strides[1] == xs.itemsize:
+                    xs = np.ascontiguousarray(xs)
+                xs = castarray(xs, self.dtype)
+                self.filehandle.puttr(start, xs, step, length)
+                return
+
+            # copying from another file with the same trace layout, e.g.
+            # f.trace = g.trace, is done in blocks of traces read and written
+            # in one call each, with no conversion in between
+            if (isinstance(val, Trace)
+                    and val.filehandle is not self.filehandle
+                    and val.shape == self.shape
+                    and val.dtype == self.dtype):
+                length = min(slicelength(start, stop, step), len(val))
+                tracesize = self.shape * self.dtype.itemsize
+                chunk = max(1, (16 * 1024 * 1024) // max(1, tracesize))
+                for k in range(0, length, chunk):
+                    n = min(chunk, length - k)
+                    xs = val.raw[k:k + n]
+                    self.filehandle.puttr(start + k * step, xs, step, n)
+                return
+
+            for j, x in zip(indices, val):
                 self[j] = x
 
             return
@@ -306,6 +382,7 @@ class Trace(Sequence):
                         len(self),
                         self.shape,
                         self.readonly,
+                        self.segy,
                        )
 
     @property
@@ -379,6 +456,10 @@ class RawTrace(Trace):
         """
         try:
             i = self.wrapindex(i)
+            mapped = self.mapped
+            if mapped is not None:
+                return mapped[i].astype(self.dtype)
+
             buf = np.zeros(self.shape, dtype = self.dtype)
             return self.filehandle.gettr(buf, i, 1, 1, 0, self.shape, 1, self.shape)
         except TypeError:
@@ -387,8 +468,14 @@ class RawTrace(Trace):
             except AttributeError:
                 msg = 'trace indices must be integers or slices, not {}'
                 raise TypeError(msg.format(type(i).__name__))
-            start, _, step = indices
-            length = len(range(*indices))
+            start, stop, step = indices
+            length = slicelength(start, stop, step)
+
+            mapped = self.mapped
+            if mapped is not None:
+                traces = slice(start, stop if stop >= 0 else None, step)
+                return mapped[traces].astype(self.dtype, order = 'C')
+
             buf = np.empty((length, self.shape), dtype = self.dtype)
             return self.filehandle.gettr(buf, start, step, length, 0, self.shape, 1, self.shape)
 
@@ -779,12 +866,23 @@ class Attributes(Sequence):
     .. versionadded:: 1.1
     """
 
-    def __init__(self, field, filehandle, tracecount):
+    def __init__(self, field, filehandle, tracecount, segy = None):
         super(Attributes, self).__init__(tracecount)
         self.field = field
         self.filehandle = filehandle
         self.tracecount = tracecount
         self.dtype = np.intc
+        self.segy = segy
+
+    @property
+    def words(self):
+        # when the file is memory mapped, words is a (strided) view of this
+        # header word in every trace, in file byte order. It is looked up on
+        # every read, so that it goes away when the file is closed
+        if self.segy is None:
+            return None
+
+        return self.segy._attribute_words(self.field)
 
     def __iter__(self):
         # attributes requires a custom iter, because self[:] returns a numpy
@@ -824,11 +922,21 @@ class Attributes(Sequence):
         >>> gy = f.attributes(segyio.TraceField.GroupY)[tracenos]
         >>> scatter(gx, gy)
         """
+        # optimize for the common case of a single, in-range trace index,
+        # which otherwise goes through array conversion and slice arithmetic
+        if isinstance(i, numbers.Integral) and 0 <= i < self.tracecount:
+            i = int(i)
+            words = self.words
+            if words is not None:
+                return words[i:i + 1].astype(self.dtype)
+
+            attrs = np.empty(1, dtype = self.dtype)
+            return self.filehandle.field_forall(attrs, i, i + 1, 1, self.field)
+
         try:
             xs = np.asarray(i, dtype = self.dtype)
             xs = xs.astype(dtype = self.dtype, order = 'C', copy = False)
-            attrs = np.empty(len(xs), dtype = self.dtype)
-            return self.filehandle.field_foreach(attrs, xs, self.field)
+            return self._getitems(xs)
 
         except TypeError:
             try:
@@ -836,15 +944,49 @@ class Attributes(Sequence):
             except TypeError:
                 pass
 
+            words = self.words
+            if words is not None:
+                # gather and byteswap all the words at once with numpy, which
+                # makes a native-endian copy
+                return words[i].astype(self.dtype)
+
             traces = self.tracecount
             filehandle = self.filehandle
             field = self.field
 
             start, stop, step = i.indices(traces)
-            indices = range(start, stop, step)
-            attrs = np.empty(len(indices), dtype = self.dtype)
+            attrs = np.empty(slicelength(start, stop, step), dtype = self.dtype)
             return filehandle.field_forall(attrs, start, stop, step, field)
 
+    def _getitems(self, xs):
+        attrs = np.empty(len(xs), dtype = self.dtype)
+        if len(xs) < 2:
+            return self.filehandle.field_foreach(attrs, xs, self.field)
+
+        lo, hi = xs.min(), xs.max()
+        inside = 0 <= lo and hi < self.tracecount
+
+        words = self.words
+        if inside and words is not None:
+            return words[xs].astype(self.dtype)
+
+        # when the indices are packed close together, it is a lot cheaper to
+        # read the full range they cover in one sweep, and pick the requested
+        # words from that
+        if inside and hi - lo < 4 * len(xs):
+            return self[lo:hi + 1][xs - lo]
+
+        # read sparse indices in file order, so that the reads move forward
+        # through the file and can be served from the same buffer
+        if len(xs) > 1024 and np.any(xs[1:] < xs[:-1]):
+            order = np.argsort(xs, kind = 'mergesort')
+            ordered = np.empty(len(xs), dtype = self.dtype)
+            self.filehandle.field_foreach(ordered, xs[order], self.field)
+            attrs[order] = ordered
+            return attrs
+
+        return self.filehandle.field_foreach(attrs, xs, self.field)
+
 class Text(Sequence):
     """Interact with segy in text mode
 
@@ -964,4 +1106,13 @@ class Text(Sequence):
     def __str__(self):
         msg = 'str(text) is deprecated, use explicit format instead'
         warnings.warn(msg, DeprecationWarning)
-        return '\n'.join(map(''.join, zip(*[iter(str(self[0]))] * 80)))
+        buf = bytes(self[0])
+        lines = (buf[i:i + 80] for i in range(0, len(buf), 80))
+        text = b'\n'.join(lines)
+
+        # on python 2 bytes is str already. On python 3, decode as latin-1,
+        # which maps every byte to exactly one character, so that NULs and
+        # other non-printable bytes are kept as-is
+        if isinstance(text, str):
+            return text
+        return text.decode('latin-1')
@@ -11,6 +11,7 @@ from types import GeneratorType
 
 import itertools
 import filecmp
+import warnings
 import shutil
 import os
 import numpy as np
@@ -194,6 +195,7 @@ def test_file_info(openfn, kwargs):
         assert 2 == f.sorting
         assert 1 == f.offsets
         assert 1 == int(f.format)
+        assert "4-byte IBM float" == str(f.format)
         assert np.single == f.dtype
 
         xlines = list(range(20, 25))
@@ -412,14 +414,17 @@ def test_write_headers_line_int_offset_slice(smallps):
         assert f.header[1][xl] == 13
         assert f.header[2][xl] == 13
 
+@pytest.mark.parametrize('use_memmap', [True, False])
 @pytest.mark.parametrize(('openfn', 'kwargs'), smallfiles)
-def test_attributes(openfn, kwargs):
-    with openfn(**kwargs) as f:
+def test_attributes(openfn, kwargs, use_memmap):
+    with openfn(use_memmap = use_memmap, **kwargs) as f:
         il = kwargs.get('iline', TraceField.INLINE_3D)
         xl = kwargs.get('xline', TraceField.CROSSLINE_3D)
 
         assert 1 == f.attributes(il)[0]
         assert 20 == f.attributes(xl)[0]
+        assert 5 == f.attributes(il)[np.int64(24)]
+        assert (1,) == f.attributes(il)[np.intc(0)].shape
 
         assert f.tracecount == len(f.attributes(il))
         assert iter(f.attributes(il))
@@ -461,6 +466,115 @@ def test_attributes(openfn, kwargs):
         attrils = list(map(int, f.attributes(il)[indices]))
         assert ils == attrils
 
+@pytest.mark.parametrize(('openfn', 'kwargs'), smallfiles)
+def test_attributes_mmap_equals_unmapped(openfn, kwargs):
+    words = [
+        TraceField.INLINE_3D,
+        TraceField.CROSSLINE_3D,
+        TraceField.offset,
+        TraceField.TRACE_SAMPLE_COUNT,
+        TraceField.TRACE_SAMPLE_INTERVAL,
+    ]
+    slices = [
+        slice(None),
+        slice(None, None, -1),
+        slice(1, 21, 3),
+        slice(22, 0, -3),
+        slice(24, 25),
+        slice(30, 40),
+        [0, 5, 11, 17, 23],
+        [23, 0, 23, 5, 11, 1, 1],
+        np.tile(np.arange(24, -1, -1), 50),
+        [7],
+    ]
+
+    with openfn(use_memmap = False, **kwargs) as f:
+        expected = [[f.attributes(w)[s] for s in slices] for w in words]
+
+    with openfn(**kwargs) as f:
+        assert f.mmap()
+        for word, exp in zip(words, expected):
+            attrs = f.attributes(word)
+            for s, x in zip(slices, exp):
+                assert attrs[s].dtype == np.intc
+                npt.assert_array_equal(attrs[s], x)
+
+            assert attrs[3] == exp[0][3]
+
+
+def test_attributes_sparse_unmapped(tmpdir):
+    spec = segyio.spec()
+    spec.format = 5
+    spec.samples = range(1)
+    spec.tracecount = 5000
+
+    fname = str(tmpdir / 'sparse.sgy')
+    with segyio.create(fname, spec) as dst:
+        dst.trace = np.zeros((spec.tracecount, 1), dtype = np.float32)
+        for i in range(spec.tracecount):
+            dst.header[i] = { TraceField.INLINE_3D: 3 * i + 7 }
+
+    rng = np.random.RandomState(0)
+    unsorted = rng.randint(0, spec.tracecount, size = 1100)
+    indices = [
+        unsorted,
+        np.sort(unsorted),
+        unsorted[:100],
+    ]
+
+    with segyio.open(fname, ignore_geometry = True, use_memmap = False) as f:
+        attrs = f.attributes(TraceField.INLINE_3D)
+        for xs in indices:
+            expected = [attrs[int(i)][0] for i in xs]
+            npt.assert_array_equal(attrs[xs], expected)
+            npt.assert_array_equal(attrs[xs], 3 * xs + 7)
+
+
+@pytest.mark.parametrize(('openfn', 'kwargs'), smallfiles)
+def test_attributes_after_close(openfn, kwargs):
+    with openfn(**kwargs) as f:
+        attrs = f.attributes(TraceField.INLINE_3D)
+        _ = attrs[:]
+
+    with pytest.raises(IOError):
+        _ = attrs[0]
+
+    with pytest.raises(IOError):
+        _ = attrs[:3]
+
+    with pytest.raises(IOError):
+        _ = attrs[[0, 5, 11]]
+
+    with pytest.raises(IOError):
+        _ = f.attributes(TraceField.INLINE_3D)[:]
+
+
+def test_mmap_after_chdir(tmpdir, monkeypatch):
+    src = str(testdata / 'multiformats' / 'Format5msb.sgy')
+    tmpdir.mkdir('a')
+    tmpdir.mkdir('b')
+    shutil.copy(src, str(tmpdir / 'a' / 'x.sgy'))
+    shutil.copy(src, str(tmpdir / 'b' / 'x.sgy'))
+
+    with segyio.open(str(tmpdir / 'b' / 'x.sgy'), 'r+',
+                     ignore_geometry = True) as g:
+        g.header[0] = { TraceField.INLINE_3D: 77 }
+        g.trace[0] = np.full(g.samples.size, 77, dtype = np.float32)
+
+    monkeypatch.chdir(str(tmpdir / 'a'))
+    with segyio.open('x.sgy', use_memmap = False,
+                     ignore_geometry = True) as f:
+        expected_il = f.attributes(TraceField.INLINE_3D)[:]
+        expected_tr = f.trace.raw[:]
+
+        monkeypatch.chdir(str(tmpdir / 'b'))
+        f.mmap()
+
+        npt.assert_array_equal(f.attributes(TraceField.INLINE_3D)[:],
+                               expected_il)
+        npt.assert_array_equal(f.trace.raw[:], expected_tr)
+        npt.assert_array_equal(f.trace[0], expected_tr[0])
+
 
 def test_iline_offset():
     with segyio.open(testdata / 'small-ps.sgy') as f:
@@ -620,6 +734,82 @@ def test_fast_slow_dimensions(openfn, kwargs):
             assert np.array_equal(xline, sline)
 
 
+@pytest.mark.parametrize(('openfn', 'kwargs'), smallfiles)
+def test_open_use_memmap(openfn, kwargs):
+    with openfn(use_memmap = False, **kwargs) as f:
+        traces = f.trace.raw[:]
+        ilines = f.attributes(TraceField.INLINE_3D)[:]
+        header = dict(f.header[10])
+
+    with openfn(**kwargs) as f:
+        npt.assert_array_equal(traces, f.trace.raw[:])
+        npt.assert_array_equal(ilines, f.attributes(TraceField.INLINE_3D)[:])
+        assert header == dict(f.header[10])
+
+def test_open_headers_only():
+    with segyio.open(testdata / 'small.sgy') as f:
+        text = f.text[0]
+        binary = dict(f.bin)
+        trace = f.trace[10]
+
+    with segyio.open(testdata / 'small.sgy', headers_only = True) as f:
+        assert text == f.text[0]
+        assert binary == dict(f.bin)
+        assert f.samples is None
+        assert f.unstructured
+        npt.assert_array_equal(trace, f.trace[10])
+
+@pytest.mark.parametrize('fmt', [2, 3, 5, 6, 8, 9, 10, 11, 12, 16])
+@pytest.mark.parametrize('endian', ['lsb', 'msb'])
+def test_traces_mapped_equals_unmapped(fmt, endian):
+    path = testdata / 'multiformats' / 'Format{}{}.sgy'.format(fmt, endian)
+    kwargs = { 'endian': endian, 'ignore_geometry': True }
+
+    def read(f):
+        return [
+            f.trace[0],
+            f.trace[-1],
+            f.trace[3, 2:10:3],
+            f.trace[3, ::-2],
+            f.trace[3, 5],
+            list(map(np.copy, f.trace[::-3, 1:4])),
+            f.trace.raw[2],
+            f.trace.raw[:],
+            f.trace.raw[::-2],
+            f.trace.raw[5:1:-1],
+        ]
+
+    with segyio.open(path, use_memmap = False, **kwargs) as f:
+        expected = read(f)
+
+    with segyio.open(path, **kwargs) as f:
+        assert f.trace.mapped is not None
+        for x, y in zip(read(f), expected):
+            npt.assert_array_equal(x, y)
+            assert np.asarray(x).dtype == f.dtype
+
+@pytest.mark.parametrize('path', ['f3.sgy', 'small.sgy'])
+def test_traces_after_close(path):
+    with segyio.open(testdata / path) as f:
+        trace = f.trace
+        raw = f.trace.raw
+        _ = f.trace[0]
+
+    with pytest.raises(IOError):
+        _ = f.trace[0]
+
+    with pytest.raises(IOError):
+        _ = f.trace.raw[:]
+
+    with pytest.raises(IOError):
+        _ = trace[0, 2:5]
+
+    with pytest.raises(IOError):
+        _ = list(trace[:2])
+
+    with pytest.raises(IOError):
+        _ = raw[:]
+
 @pytest.mark.parametrize(('openfn', 'kwargs'), smallfiles)
 def test_traces_raw(openfn, kwargs):
     with openfn(**kwargs) as f:
@@ -648,6 +838,14 @@ def test_read_header_embedded_null():
         text = f.text[0]
         assert len(text) == 3200
 
+        with pytest.deprecated_call():
+            s = str(f.text)
+
+        lines = s.split('\n')
+        assert 40 == len(lines)
+        assert all(len(line) == 80 for line in lines)
+        assert '\x00' in s
+
 def test_read_text_sequence():
     with segyio.open(testdata / 'multi-text.sgy', ignore_geometry = True) as f:
         for text in f.text[:]:
@@ -655,7 +853,12 @@ def test_read_text_sequence():
 
         assert iter(f.text)
         with pytest.deprecated_call():
-            str(f.text)
+            s = str(f.text)
+
+        lines = s.split('\n')
+        assert 40 == len(lines)
+        assert all(len(line) == 80 for line in lines)
+        assert lines[0].startswith('C 1')
 
 
 @tmpfiles(testdata / 'multi-text.sgy')
@@ -879,6 +1082,40 @@ def test_write_binary(small):
         f.bin = f.bin
 
 
+def test_binary_handles_coherent(small):
+    with segyio.open(small, "r+") as f:
+        b = f.bin
+        assert b is f.bin
+
+        f.bin = { BinField.Traces: 43 }
+        assert 43 == b[BinField.Traces]
+
+        b[BinField.SweepFrequencyStart] = 11
+        assert 11 == f.bin[BinField.SweepFrequencyStart]
+
+    with segyio.open(small) as f:
+        assert 43 == f.bin[BinField.Traces]
+        assert 11 == f.bin[BinField.SweepFrequencyStart]
+
+
+def test_binary_failed_write_keeps_cache():
+    with segyio.open(testdata / 'small.sgy') as f:
+        interval = f.bin[BinField.Interval]
+        traces = f.bin[BinField.Traces]
+
+        with pytest.raises(IOError):
+            f.bin[BinField.Interval] = 1234
+        assert interval == f.bin[BinField.Interval]
+
+        with pytest.raises(IOError):
+            f.bin.update({ BinField.Traces: 3 })
+        assert traces == f.bin[BinField.Traces]
+
+        with pytest.raises(IOError):
+            f.bin = { BinField.Interval: 1234 }
+        assert interval == f.bin[BinField.Interval]
+
+
 def test_write_header_update_atomic(small):
     with segyio.open(small, "r+") as f:
         orig = dict(f.header[10])
@@ -1071,6 +1308,48 @@ def test_assign_all_traces(small):
         assert np.array_equal(f.trace.raw[:], traces)
 
 
+def test_assign_traces_from_file(small):
+    orig = str(small.dirname + '/small.sgy')
+    copy = str(small.dirname + '/copy.sgy')
+    shutil.copy(orig, copy)
+
+    with segyio.open(copy, 'r+') as f:
+        f.trace = np.zeros((f.tracecount, len(f.samples)), dtype = f.dtype)
+
+    with segyio.open(orig) as src, segyio.open(copy, 'r+') as dst:
+        expected = src.trace.raw[:]
+        dst.trace[::-1] = src.trace
+        assert np.array_equal(dst.trace.raw[:], expected[::-1])
+
+        dst.trace = src.trace
+        assert np.array_equal(dst.trace.raw[:], expected)
+
+
+def test_assign_traces_strided_block(small):
+    with segyio.open(small, 'r+') as f:
+        orig = f.trace.raw[:]
+        block = np.arange(5 * len(f.samples), dtype='single')
+        block = block.reshape(5, len(f.samples))
+
+        # 6 traces in the destination, the block is exhausted after 5
+        f.trace[-1:0:-4] = block
+        expected = np.copy(orig)
+        expected[-1:4:-4] = block
+        assert np.array_equal(f.trace.raw[:], expected)
+
+        # the right-hand-side is exhausted before the destination
+        f.trace[:] = block[:2]
+        expected[:2] = block[:2]
+        assert np.array_equal(f.trace.raw[:], expected)
+
+        # every other row of a block is fine, as each row is contiguous
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            f.trace[0:3] = block[::2]
+        expected[0:3] = block[::2]
+        assert np.array_equal(f.trace.raw[:], expected)
+
+
 def test_traceaccess_from_array():
     a = np.arange(10, dtype=np.int)
     b = np.arange(10, dtype=np.int32)
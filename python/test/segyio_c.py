@@ -515,6 +515,18 @@ def read_and_write_trace(f, mmap):
 
     assert sum(buf) == approx(42.0 * 25, abs=1e-4)
 
+    buf = numpy.arange(3 * 25, dtype=numpy.single)
+    f.puttr(4, buf, -2, 3)
+
+    f.flush()
+
+    out = numpy.zeros(3 * 25, dtype=numpy.single)
+    f.gettr(out, 4, -2, 3, 0, 25, 1, 25)
+    assert numpy.array_equal(buf, out)
+
+    with pytest.raises(ValueError):
+        f.puttr(0, buf, 1, 4)
+
     f.close()
 
 